@@ -1,6 +1,6 @@
-from typing import List
+from typing import List, Optional
 
-from fastapi import HTTPException, Depends, APIRouter
+from fastapi import HTTPException, Depends, APIRouter, Query
 from sqlalchemy.orm import Session
 from app.schemas.schemas import PostCreate, Post, User
 from app.models.database import get_db
@@ -8,6 +8,7 @@ from app.models.posts import Post as DBPost
 from app.services.auth import get_current_user
 from app.models.likes import Like as DBLike
 from app.schemas.schemas import Like
+from app.services.loaders import MAX_IDS_PER_REQUEST, BatchLoader, get_post_loader
 
 router = APIRouter()
 
@@ -77,10 +78,16 @@ def get_post(post_id: int, db: Session = Depends(get_db), current_user: User = D
 
 
 @router.get("/posts/", response_model=List[Post])
-def get_posts(db: Session = Depends(get_db)):
+def get_posts(ids: Optional[List[int]] = Query(None, max_items=MAX_IDS_PER_REQUEST),
+              db: Session = Depends(get_db),
+              loader: BatchLoader[DBPost] = Depends(get_post_loader)):
     """
     Получить список всех постов на сайте
+
+    - **ids**: Вернуть только посты с указанными ID (`?ids=1&ids=2`), не обязательно
     """
+    if ids:
+        return loader.load_many(ids)
     db_posts = db.query(DBPost).all()
     return db_posts
 
@@ -1,7 +1,8 @@
 import os
+from typing import List
 
 import requests
-from fastapi import HTTPException, Depends, status, APIRouter, Body
+from fastapi import HTTPException, Depends, status, APIRouter, Body, Query
 from datetime import timedelta
 from sqlalchemy.orm import Session
 
@@ -18,6 +19,7 @@ from app.services.auth import (
 
 from dotenv import load_dotenv
 
+from app.services.loaders import MAX_IDS_PER_REQUEST, BatchLoader, get_user_loader
 from app.services.requests_db import get_user_by_email
 
 load_dotenv()
@@ -88,12 +90,27 @@ async def read_users_me(current_user: schemas.User = Depends(get_current_user)):
     return current_user
 
 
-@router.get("/users/{user_id}", response_model=schemas.User)
-def get_current_use_by_id(db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
+@router.get("/users/", response_model=List[schemas.UserPublic])
+def get_users_by_ids(ids: List[int] = Query(..., max_items=MAX_IDS_PER_REQUEST),
+                     current_user: User = Depends(get_current_user),
+                     loader: BatchLoader[User] = Depends(get_user_loader)):
+    """
+    Получить информацию о нескольких пользователях одним запросом
+
+    - **ids**: ID пользователей (`?ids=1&ids=2`)
+    """
+    return loader.load_many(ids)
+
+
+@router.get("/users/{user_id}", response_model=schemas.UserPublic)
+def get_current_use_by_id(user_id: int, current_user: User = Depends(get_current_user),
+                          loader: BatchLoader[User] = Depends(get_user_loader)):
     """
     Получить информацию о пользователе по id
+
+    - **user_id**: ID пользователя
     """
-    db_user = get_user(db, str(current_user.username))
+    db_user = loader.load(user_id)
     if db_user is None:
         raise HTTPException(status_code=404, detail="User not found")
     return db_user
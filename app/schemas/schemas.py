@@ -20,6 +20,14 @@ class User(UserBase):
         orm_mode = True
 
 
+class UserPublic(BaseModel):
+    id: int
+    username: str
+
+    class Config:
+        orm_mode = True
+
+
 class Token(BaseModel):
     access_token: str
     token_type: str
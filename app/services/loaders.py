@@ -0,0 +1,65 @@
+from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, Protocol, TypeVar
+
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from app.models.database import get_db
+from app.models.posts import Post
+from app.models.user import User
+from app.services.requests_db import get_posts_by_ids, get_users_by_ids
+
+class _HasId(Protocol):
+    id: Any
+
+
+T = TypeVar("T", bound=_HasId)
+
+# Ограничение на число id в одном multi-get запросе: держит `IN (...)`
+# далеко от лимита SQLite на количество параметров.
+MAX_IDS_PER_REQUEST = 100
+
+
+class BatchLoader(Generic[T]):
+    """
+    Кэш объектов по id на время одного HTTP-запроса. `load_many` достаёт
+    все ещё не загруженные id одним запросом `WHERE id IN (...)`, повторные
+    обращения к уже загруженным id в базу не ходят.
+
+    FastAPI кэширует зависимости в рамках запроса, поэтому обработчик и все его
+    зависимости, запросившие `get_user_loader` / `get_post_loader`, получают
+    один и тот же загрузчик. Сейчас каждый маршрут обращается к нему один раз,
+    и выигрыш даёт только один `IN (...)` вместо запроса на каждый id; кэш
+    пригодится зависимостям, которые подгружают те же объекты (например,
+    авторов постов) в том же запросе.
+    """
+
+    def __init__(self, db: Session, batch_fn: Callable[[Session, Iterable[int]], List[T]]):
+        self._db = db
+        self._batch_fn = batch_fn
+        self._cache: Dict[int, Optional[T]] = {}
+
+    def load(self, key: int) -> Optional[T]:
+        self._fetch([key])
+        return self._cache[key]
+
+    def load_many(self, keys: Iterable[int]) -> List[T]:
+        """Вернуть найденные объекты в порядке запрошенных id, без повторов."""
+        keys = list(dict.fromkeys(keys))
+        self._fetch(keys)
+        return [obj for obj in (self._cache[key] for key in keys) if obj is not None]
+
+    def _fetch(self, keys: List[int]) -> None:
+        missing = [key for key in keys if key not in self._cache]
+        if not missing:
+            return
+        rows = {row.id: row for row in self._batch_fn(self._db, missing)}
+        for key in missing:
+            self._cache[key] = rows.get(key)
+
+
+def get_user_loader(db: Session = Depends(get_db)) -> BatchLoader[User]:
+    return BatchLoader(db, get_users_by_ids)
+
+
+def get_post_loader(db: Session = Depends(get_db)) -> BatchLoader[Post]:
+    return BatchLoader(db, get_posts_by_ids)
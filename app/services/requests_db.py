@@ -1,11 +1,18 @@
+from typing import Iterable, List
+
 from sqlalchemy.orm import Session
 
+from app.models.posts import Post
 from app.models.user import User
 
 
-def get_user_by_id(db: Session, user_id: int):
-    return db.query(User).filter(User.id == user_id).first()
-
-
 def get_user_by_email(db: Session, user_email: str):
     return db.query(User).filter(User.email == user_email).first()
+
+
+def get_users_by_ids(db: Session, user_ids: Iterable[int]) -> List[User]:
+    return db.query(User).filter(User.id.in_(list(user_ids))).all()
+
+
+def get_posts_by_ids(db: Session, post_ids: Iterable[int]) -> List[Post]:
+    return db.query(Post).filter(Post.id.in_(list(post_ids))).all()
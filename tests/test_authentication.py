@@ -73,3 +73,35 @@ def test_read_users_me_no_token(test_db, test_user):
     response = client.get("/api/users/me/")
     assert response.status_code == 403, response.text
     assert response.json() == {"detail": "Not authenticated"}
+
+
+def test_read_user_by_id(test_db, test_user):
+    response = client.post("/api/login", json=test_user_data)
+    token = response.json()["access_token"]
+    response = client.get(f"/api/users/{test_user.id}", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200, response.text
+    assert response.json() == {"id": test_user.id, "username": test_user_data["username"]}
+    response = client.get(f"/api/users/{test_user.id + 1}", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 404, response.text
+
+
+def test_read_users_by_ids(test_db, test_user):
+    other_user = User(username="otheruser", hashed_password=get_password_hash("otherpassword"))
+    test_db.add(other_user)
+    test_db.commit()
+    response = client.post("/api/login", json=test_user_data)
+    token = response.json()["access_token"]
+    response = client.get("/api/users/", params={"ids": [other_user.id, test_user.id, other_user.id, 999]},
+                          headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200, response.text
+    assert [user["id"] for user in response.json()] == [other_user.id, test_user.id]
+    assert all(set(user) == {"id", "username"} for user in response.json())
+
+
+def test_read_users_by_ids_too_many(test_db, test_user):
+    response = client.post("/api/login", json=test_user_data)
+    token = response.json()["access_token"]
+    response = client.get("/api/users/", params={"ids": list(range(1, 102))},
+                          headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 422, response.text
+    assert response.json()["detail"][0]["loc"] == ["query", "ids"]
@@ -0,0 +1,58 @@
+from types import SimpleNamespace
+
+from fastapi import Depends, FastAPI
+from starlette.testclient import TestClient
+
+from app.services.loaders import BatchLoader, get_post_loader
+
+
+class CountingBatch:
+    def __init__(self, existing_ids):
+        self.existing_ids = set(existing_ids)
+        self.calls = []
+
+    def __call__(self, db, ids):
+        ids = list(ids)
+        self.calls.append(ids)
+        return [SimpleNamespace(id=i) for i in ids if i in self.existing_ids]
+
+
+def test_load_many_uses_one_query():
+    batch = CountingBatch([1, 2, 3])
+    loader = BatchLoader(None, batch)
+    result = loader.load_many([1, 2, 2, 3])
+    assert [obj.id for obj in result] == [1, 2, 3]
+    assert batch.calls == [[1, 2, 3]]
+
+
+def test_loaded_ids_are_cached():
+    batch = CountingBatch([1, 2, 3])
+    loader = BatchLoader(None, batch)
+    loader.load_many([1, 2])
+    assert loader.load(1).id == 1
+    assert [obj.id for obj in loader.load_many([2, 1])] == [2, 1]
+    assert len(batch.calls) == 1
+    loader.load_many([1, 3])
+    assert batch.calls[1] == [3]
+
+
+def test_missing_id_is_none_and_cached():
+    batch = CountingBatch([1])
+    loader = BatchLoader(None, batch)
+    assert loader.load(42) is None
+    assert loader.load_many([1, 42])[0].id == 1
+    assert len(loader.load_many([1, 42])) == 1
+    assert batch.calls == [[42], [1]]
+
+
+def test_loader_is_shared_within_request():
+    app = FastAPI()
+
+    def first_post_loader(loader=Depends(get_post_loader)):
+        return loader
+
+    @app.get("/")
+    def handler(loader=Depends(get_post_loader), other=Depends(first_post_loader)):
+        return {"shared": loader is other}
+
+    assert TestClient(app).get("/").json() == {"shared": True}
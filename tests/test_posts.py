@@ -1,4 +1,5 @@
 import pytest
+from sqlalchemy import event
 from starlette.testclient import TestClient
 
 from app.main import app
@@ -145,3 +146,30 @@ def test_unlike_post(test_db, test_user, test_user2, test_post):
     assert "id" in data
     assert data["user_id"] == test_user2.id
     assert data["post_id"] == test_post.id
+
+
+def test_get_posts_by_ids(test_db, test_user, test_post):
+    other_post = DBPost(title="Other title", content="Other content", user_id=test_user.id)
+    test_db.add(other_post)
+    test_db.commit()
+    ids = [other_post.id, test_post.id, test_post.id, 999]
+    statements = []
+
+    def count_posts_queries(conn, cursor, statement, parameters, context, executemany):
+        if "FROM posts" in statement:
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", count_posts_queries)
+    try:
+        response = client.get("/api/posts/", params={"ids": ids})
+    finally:
+        event.remove(engine, "before_cursor_execute", count_posts_queries)
+    assert response.status_code == 200, response.text
+    assert [post["id"] for post in response.json()] == ids[:2]
+    assert len(statements) == 1
+
+
+def test_get_posts_by_ids_too_many(test_db):
+    response = client.get("/api/posts/", params={"ids": list(range(1, 102))})
+    assert response.status_code == 422, response.text
+    assert response.json()["detail"][0]["loc"] == ["query", "ids"]